@@ -10,21 +10,169 @@ This is a critical validation to ensure metric accuracy.
 """
 
 import argparse
+import copy
+import functools
+import io
+import itertools
 import json
+import os
+import re
 import sys
 import time
-import urllib.error
-import urllib.parse
-import urllib.request
-from typing import Dict, List, Optional, Set, Tuple
-from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, FrozenSet, Iterator, List, Optional, Tuple
+from collections import Counter, defaultdict
 
 try:
-    import yaml
+    import urllib3
+    from urllib3.util.retry import Retry
 except ImportError:
-    print("❌ PyYAML not installed. Install with: pip install pyyaml")
+    print("❌ urllib3 not installed. Install with: pip install urllib3")
     sys.exit(1)
 
+# orjson encodes/decodes block payloads several times faster; optional
+try:
+    import orjson
+
+    json_loads = orjson.loads
+    json_dumps = orjson.dumps
+except ImportError:
+    json_loads = json.loads
+
+    def json_dumps(obj) -> bytes:
+        # Same compact UTF-8 output as orjson.dumps
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode()
+
+
+# Concurrent block fetches; kept below the connection pool size so workers
+# reuse pooled sockets instead of opening new ones.
+BLOCK_FETCH_WORKERS = 16
+
+# Sent with every request; asks proxies in front of the RPC to keep
+# connections open for reuse as well
+HTTP_HEADERS = {"Connection": "keep-alive"}
+
+# Blocks per JSON-RPC batch request; CometBFT's default
+# rpc.max_request_batch_size is 10
+BLOCK_BATCH_SIZE = 10
+
+# Max block headers CometBFT returns per blockchain?minHeight=&maxHeight= call
+BLOCKCHAIN_PAGE_SIZE = 20
+
+# Any YAML 1.1 spelling of a true "enabled:" value, in any case and optionally
+# quoted; a superset of the grep test-envs.sh uses to decide whether to run
+# this script
+ENABLED_TRUE_RE = re.compile(rb"(?i)enabled\s*:\s*[\"']?(?:true|yes|on)\b")
+
+# Status icons used in the results report
+OK_ICON = "✅"
+WARN_ICON = "⚠️"
+ERR_ICON = "❌"
+
+# Issues main reports as errors: gap too large, current_block_height missing
+CRITICAL_ISSUE_RE = re.compile(
+    r"gap too large|^(?=.*not found)(?=.*current_block_height)", re.I | re.S
+)
+
+# Seconds between metrics polls while waiting for blocks; the last entry
+# repeats once the schedule is exhausted
+POLL_SCHEDULE = (0.2, 0.2, 0.5, 0.5, 1.0, 2.0, 5.0)
+
+# Seconds a fetched validator set is reused before asking the RPC again
+VALIDATORS_CACHE_TTL = 10.0
+
+# Max age (seconds) of the last poll scrape for it to be reused for validation
+METRICS_STALENESS_BUDGET = 2.0
+
+# Parsed metrics: metric name -> [(label pairs, value), ...]
+MetricsStore = Dict[str, List[Tuple[FrozenSet[Tuple[str, str]], float]]]
+NO_LABELS: FrozenSet[Tuple[str, str]] = frozenset()
+# One parsed metric line: (name, label pairs, value)
+Sample = Tuple[str, FrozenSet[Tuple[str, str]], float]
+
+CURRENT_BLOCK_HEIGHT = "rcosmos_cometbft_current_block_height"
+BLOCK_TXS = "rcosmos_cometbft_block_txs"
+BLOCK_GAP = "rcosmos_cometbft_block_gap"
+VALIDATOR_MISSED_BLOCKS = "rcosmos_cometbft_validator_missed_blocks"
+# Everything else on /metrics is dropped while parsing
+WANTED_METRICS = frozenset(
+    (CURRENT_BLOCK_HEIGHT, BLOCK_TXS, BLOCK_GAP, VALIDATOR_MISSED_BLOCKS)
+)
+
+
+def parse_labels(label_part: str) -> FrozenSet[Tuple[str, str]]:
+    """Parse the inside of a Prometheus label block: a="1",b="2"."""
+    labels = []
+    pos = 0
+    while True:
+        eq = label_part.find("=", pos)
+        if eq == -1:
+            break
+        start = label_part.find('"', eq) + 1
+        if start == 0:
+            break
+        end = label_part.find('"', start)
+        while end != -1 and label_part[end - 1] == "\\":
+            end = label_part.find('"', end + 1)
+        if end == -1:
+            break
+        labels.append((label_part[pos:eq].strip(), label_part[start:end]))
+        comma = label_part.find(",", end)
+        if comma == -1:
+            break
+        pos = comma + 1
+    return frozenset(labels)
+
+
+def parse_sample(
+    line: str, allowlist: Optional[FrozenSet[str]] = None
+) -> Optional[Sample]:
+    """Parse one Prometheus text line.
+
+    Returns None for comments, bad lines, and metrics not in allowlist (if
+    given); the allowlist is checked before any label or value parsing.
+    """
+    line = line.strip()
+    if not line or line[0] == "#":
+        return None
+    # Parse: metric_name{labels} value [timestamp]; tokens may be separated
+    # by any run of blanks or tabs
+    brace = line.find("{")
+    space = line.find(" ")
+    tab = line.find("\t")
+    if tab != -1 and (space == -1 or tab < space):
+        space = tab
+    if brace != -1 and (space == -1 or brace < space):
+        # Has labels
+        name = line[:brace]
+        if allowlist is not None and name not in allowlist:
+            return None
+        close = line.rfind("}", brace)
+        if close == -1:
+            return None
+        labels = parse_labels(line[brace + 1 : close])
+        rest = line[close + 1 :]
+    else:
+        # No labels
+        if space == -1:
+            return None
+        name = line[:space]
+        if allowlist is not None and name not in allowlist:
+            return None
+        labels = NO_LABELS
+        rest = line[space + 1 :]
+    tokens = rest.split()
+    if not tokens:
+        return None
+    value_part = tokens[0]
+    # Skip +Inf/-Inf/NaN samples (histogram buckets etc.)
+    if value_part[-1:] in ("f", "N"):
+        return None
+    try:
+        return name, labels, float(value_part)
+    except ValueError:
+        return None
+
 
 class MetricValidator:
     """Validates exporter metrics against RPC data."""
@@ -34,114 +182,295 @@ class MetricValidator:
         self.metrics_url = metrics_url.rstrip("/")
         self.chain_id = chain_id
         self.network = network
+        # RPC endpoints, built once rather than per request
+        self._status_url = f"{self.rpc_url}/status"
+        self._validators_url = f"{self.rpc_url}/validators"
+        self._block_url_fmt = self.rpc_url + "/block?height={}"
+        self._jsonrpc_url = f"{self.rpc_url}/"
+        # Labels every queried metric is scoped by, built once per run
+        self._base_labels = (("chain_id", chain_id), ("network", network))
+        self._chain_labels = frozenset(self._base_labels)
+        # Committed blocks never change, so every check in a run shares them
+        self._block_cache: Dict[int, Dict] = {}
+        self._validators_cache: Optional[Tuple[float, List[Dict]]] = None
+        # One keep-alive pool shared by every RPC and metrics request, so block
+        # sampling doesn't pay a TCP/TLS handshake per height. Sized for every
+        # fetch worker plus the main thread; block=True makes a caller wait for
+        # a pooled connection instead of opening one that is thrown away.
+        self._http = urllib3.PoolManager(
+            num_pools=4,
+            maxsize=BLOCK_FETCH_WORKERS + 1,
+            block=True,
+            retries=Retry(total=3, backoff_factor=0.2),
+            headers=HTTP_HEADERS,
+        )
+        # Per-request headers replace the pool defaults, so merge them in
+        self._metrics_headers = {**HTTP_HEADERS, "Accept-Encoding": "identity"}
+        self._json_headers = {**HTTP_HEADERS, "Content-Type": "application/json"}
+        # Cleared the first time the RPC rejects a JSON-RPC batch
+        self._batch_rpc = True
+        # Worker threads for block fetches, started on first use and shared by
+        # every check in the run
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def close(self):
+        """Stop fetch workers and release pooled connections."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        self._http.clear()
+
+    def __enter__(self) -> "MetricValidator":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def _get(self, url: str, timeout: float) -> bytes:
+        """GET a URL through the shared pool and return the response body."""
+        response = self._http.request("GET", url, timeout=timeout)
+        if response.status >= 400:
+            raise urllib3.exceptions.HTTPError(f"HTTP {response.status} for {url}")
+        return response.data
+
+    def _post(self, url: str, body: bytes, timeout: float) -> bytes:
+        """POST a JSON body through the shared pool and return the response body."""
+        response = self._http.request(
+            "POST", url, body=body, headers=self._json_headers, timeout=timeout
+        )
+        if response.status >= 400:
+            raise urllib3.exceptions.HTTPError(f"HTTP {response.status} for {url}")
+        return response.data
 
     def fetch_rpc(self, path: str) -> Dict:
         """Fetch data from RPC endpoint."""
-        url = f"{self.rpc_url}/{path}"
+        return self._fetch_rpc_url(f"{self.rpc_url}/{path}")
+
+    def _fetch_rpc_url(self, url: str) -> Dict:
+        """Fetch data from a full RPC URL."""
         try:
-            with urllib.request.urlopen(url, timeout=30) as response:
-                return json.loads(response.read())
-        except urllib.error.URLError as e:
+            return json_loads(self._get(url, timeout=30))
+        except urllib3.exceptions.HTTPError as e:
             raise Exception(f"RPC request failed: {e}")
 
-    def fetch_metrics(self) -> str:
-        """Fetch metrics from exporter."""
+    def iter_metrics(
+        self, allowlist: Optional[FrozenSet[str]] = None
+    ) -> Iterator[Sample]:
+        """Stream metrics from exporter, yielding samples as lines arrive.
+
+        If allowlist is given, only samples of those metric names are yielded.
+        """
         try:
-            with urllib.request.urlopen(self.metrics_url, timeout=10) as response:
-                return response.read().decode("utf-8")
-        except urllib.error.URLError as e:
+            # Skip compression: on a local scrape it costs more than it saves
+            response = self._http.request(
+                "GET",
+                self.metrics_url,
+                headers=self._metrics_headers,
+                timeout=10,
+                preload_content=False,
+            )
+            try:
+                if response.status >= 400:
+                    raise urllib3.exceptions.HTTPError(
+                        f"HTTP {response.status} for {self.metrics_url}"
+                    )
+                response.auto_close = False
+                # Hot loop: bind the parser locally and drop # HELP / # TYPE
+                # lines, indented or not, before paying for a call on them
+                parse = parse_sample
+                for line in io.TextIOWrapper(response, encoding="utf-8"):
+                    head = line[0]
+                    if head == "#" or (head in " \t" and line.lstrip()[:1] == "#"):
+                        continue
+                    sample = parse(line, allowlist)
+                    if sample is not None:
+                        yield sample
+            finally:
+                response.drain_conn()
+                response.release_conn()
+        except urllib3.exceptions.HTTPError as e:
             raise Exception(f"Metrics request failed: {e}")
 
-    def parse_metrics(self, metrics_text: str) -> Dict[str, float]:
-        """Parse Prometheus metrics text into a dictionary."""
-        metrics = {}
-        for line in metrics_text.split("\n"):
-            line = line.strip()
-            if not line or line.startswith("#"):
-                continue
-            # Parse: metric_name{labels} value
-            if "{" in line:
-                # Has labels
-                parts = line.split("}")
-                if len(parts) == 2:
-                    metric_part = parts[0] + "}"
-                    value_part = parts[1].strip()
-                    try:
-                        value = float(value_part)
-                        metrics[metric_part] = value
-                    except ValueError:
-                        pass
-            else:
-                # No labels
-                parts = line.split()
-                if len(parts) == 2:
-                    try:
-                        metrics[parts[0]] = float(parts[1])
-                    except ValueError:
-                        pass
-        return metrics
+    def fetch_metrics(self) -> MetricsStore:
+        """Fetch the metrics validation uses into a store indexed by name."""
+        metrics = defaultdict(list)
+        for name, labels, value in self.iter_metrics(WANTED_METRICS):
+            metrics[name].append((labels, value))
+        return dict(metrics)
 
     def get_metric_value(
         self,
-        metrics: Dict[str, float],
+        metrics: MetricsStore,
         metric_name: str,
         labels: Optional[Dict[str, str]] = None,
     ) -> Optional[float]:
-        """Get metric value by name and optional labels."""
-        if labels:
-            # Build label string
-            label_str = ",".join([f'{k}="{v}"' for k, v in labels.items()])
-            key = f"{metric_name}{{{label_str}}}"
-        else:
-            key = metric_name
-
-        # Try exact match first
-        if key in metrics:
-            return metrics[key]
-
-        # Try partial match (for labels that might be in different order)
-        for k, v in metrics.items():
-            if k.startswith(metric_name + "{") and k.endswith("}"):
-                # Parse labels from key
-                label_part = k[len(metric_name) + 1 : -1]
-                label_dict = {}
-                for label in label_part.split(","):
-                    if "=" in label:
-                        k2, v2 = label.split("=", 1)
-                        label_dict[k2.strip()] = v2.strip('"')
-                # Check if all required labels match
-                if all(label_dict.get(k) == v for k, v in labels.items() if labels):
-                    return v
+        """Get metric value by name and optional labels.
+
+        Returns the first sample of the metric whose labels include all of the
+        requested ones.
+        """
+        required = frozenset(labels.items()) if labels else NO_LABELS
+        return self._lookup(metrics, metric_name, required)
 
+    def _lookup(
+        self,
+        metrics: MetricsStore,
+        metric_name: str,
+        required: FrozenSet[Tuple[str, str]],
+    ) -> Optional[float]:
+        """Get metric value by name and a prebuilt label set."""
+        for label_set, value in metrics.get(metric_name, ()):
+            if required <= label_set:
+                return value
         return None
 
+    def _chain_metric(self, metrics: MetricsStore, metric_name: str) -> Optional[float]:
+        """Get a metric scoped to this chain_id/network."""
+        return self._lookup(metrics, metric_name, self._chain_labels)
+
+    def _missed_for(self, metrics: MetricsStore, addr: str) -> Optional[float]:
+        """Get the missed_blocks counter for a validator on this chain."""
+        required = frozenset((("address", addr),) + self._base_labels)
+        return self._lookup(metrics, VALIDATOR_MISSED_BLOCKS, required)
+
+    def _missed_by_address(self, metrics: MetricsStore) -> Dict[str, float]:
+        """Get missed_blocks counters on this chain keyed by validator address."""
+        missed = {}
+        for label_set, value in metrics.get(VALIDATOR_MISSED_BLOCKS, ()):
+            if self._chain_labels <= label_set:
+                addr = dict(label_set).get("address")
+                if addr is not None:
+                    missed.setdefault(addr, value)
+        return missed
+
     def get_latest_block_height(self) -> int:
         """Get latest block height from RPC."""
-        response = self.fetch_rpc("status")
+        response = self._fetch_rpc_url(self._status_url)
         return int(response["result"]["sync_info"]["latest_block_height"])
 
     def get_block(self, height: int) -> Dict:
-        """Get block data from RPC."""
-        response = self.fetch_rpc(f"block?height={height}")
-        return response["result"]["block"]
+        """Get block data from RPC, reusing blocks already fetched this run."""
+        block = self._block_cache.get(height)
+        if block is None:
+            response = self._fetch_rpc_url(self._block_url_fmt.format(height))
+            block = self._block_cache[height] = response["result"]["block"]
+        return block
+
+    def get_blocks(
+        self, heights: List[int]
+    ) -> Tuple[Dict[int, Dict], Dict[int, Exception]]:
+        """Fetch several blocks concurrently.
+
+        Uncached heights are requested as JSON-RPC batches, falling back to one
+        request per height if the RPC rejects batches. Returns blocks by height,
+        plus the exception for each height that failed.
+        """
+        blocks = {}
+        failures = {}
+        missing = []
+        for height in heights:
+            block = self._block_cache.get(height)
+            if block is None:
+                missing.append(height)
+            else:
+                blocks[height] = block
+        if not missing:
+            return blocks, failures
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=BLOCK_FETCH_WORKERS, thread_name_prefix="block-fetch"
+            )
 
-    def get_validators(self) -> List[Dict]:
-        """Get validator set from RPC."""
-        response = self.fetch_rpc("validators")
-        return response["result"]["validators"]
+        if self._batch_rpc:
+            batches = [
+                missing[i : i + BLOCK_BATCH_SIZE]
+                for i in range(0, len(missing), BLOCK_BATCH_SIZE)
+            ]
+            futures = {
+                self._executor.submit(self._fetch_block_batch, batch): batch
+                for batch in batches
+            }
+            missing = []
+            for future in as_completed(futures):
+                try:
+                    batch_blocks, batch_failures = future.result()
+                except Exception:
+                    # Batching unsupported (e.g. disabled or behind a proxy)
+                    self._batch_rpc = False
+                    missing.extend(futures[future])
+                    continue
+                blocks.update(batch_blocks)
+                failures.update(batch_failures)
+
+        futures = {self._executor.submit(self.get_block, h): h for h in missing}
+        for future in as_completed(futures):
+            height = futures[future]
+            try:
+                blocks[height] = future.result()
+            except Exception as e:
+                failures[height] = e
+        return blocks, failures
+
+    def _fetch_block_batch(
+        self, heights: List[int]
+    ) -> Tuple[Dict[int, Dict], Dict[int, Exception]]:
+        """Fetch blocks in one JSON-RPC batch request.
+
+        Raises if the RPC doesn't answer with a reply for every request;
+        per-height errors inside the batch are returned as failures.
+        """
+        body = json_dumps(
+            [
+                {
+                    "jsonrpc": "2.0",
+                    "id": i,
+                    "method": "block",
+                    "params": {"height": str(h)},
+                }
+                for i, h in enumerate(heights)
+            ]
+        )
+        replies = json_loads(self._post(self._jsonrpc_url, body, timeout=30))
+        if not isinstance(replies, list):
+            raise ValueError("RPC did not return a batch response")
+        replies_by_id = {reply.get("id"): reply for reply in replies}
+        if any(i not in replies_by_id for i in range(len(heights))):
+            raise ValueError("RPC batch response is missing replies")
+        blocks = {}
+        failures = {}
+        for i, height in enumerate(heights):
+            reply = replies_by_id[i]
+            if reply.get("error"):
+                failures[height] = Exception(f"RPC request failed: {reply['error']}")
+            else:
+                block = self._block_cache[height] = reply["result"]["block"]
+                blocks[height] = block
+        return blocks, failures
 
-    def calculate_expected_signatures(self, block: Dict) -> Set[str]:
+    def get_validators(self) -> List[Dict]:
+        """Get validator set from RPC, reusing a recent response."""
+        now = time.monotonic()
+        if (
+            self._validators_cache is not None
+            and now - self._validators_cache[0] < VALIDATORS_CACHE_TTL
+        ):
+            return self._validators_cache[1]
+        response = self._fetch_rpc_url(self._validators_url)
+        validators = response["result"]["validators"]
+        self._validators_cache = (now, validators)
+        return validators
+
+    def calculate_expected_signatures(self, block: Dict) -> FrozenSet[str]:
         """Calculate expected validator signatures from block."""
-        signatures = set()
-        last_commit = block.get("last_commit", {})
-        for sig in last_commit.get("signatures", []):
-            validator_addr = sig.get("validator_address", "")
-            if validator_addr:
-                signatures.add(validator_addr)
-        return signatures
+        signatures = block.get("last_commit", {}).get("signatures", ())
+        return frozenset(
+            sig["validator_address"]
+            for sig in signatures
+            if sig.get("validator_address")
+        )
 
     def validate_block_metrics(
-        self, height: int, block: Dict, metrics: Dict[str, float]
+        self, height: int, block: Dict, metrics: MetricsStore
     ) -> Tuple[bool, List[str]]:
         """Validate metrics for a specific block."""
         errors = []
@@ -153,11 +482,7 @@ class MetricValidator:
 
         # 1. Validate block_txs (transaction count) - just verify metric exists
         expected_txs = len(block.get("data", {}).get("txs", []))
-        actual_txs = self.get_metric_value(
-            metrics,
-            "rcosmos_cometbft_block_txs",
-            {"chain_id": self.chain_id, "network": self.network},
-        )
+        actual_txs = self._chain_metric(metrics, BLOCK_TXS)
         if actual_txs is not None and actual_txs != expected_txs:
             # This might be from a different block, so it's a warning
             warnings.append(
@@ -174,23 +499,18 @@ class MetricValidator:
         return len(errors) == 0, errors + warnings
 
     def validate_monotonicity(
-        self, initial_metrics: Dict[str, float], final_metrics: Dict[str, float]
+        self,
+        initial_metrics: MetricsStore,
+        final_metrics: MetricsStore,
+        validators: Optional[List[Dict]] = None,
     ) -> Tuple[bool, List[str]]:
         """Validate that counters are monotonic (only increase)."""
         errors = []
         warnings = []
 
         # Check current_block_height is monotonic
-        initial_height = self.get_metric_value(
-            initial_metrics,
-            "rcosmos_cometbft_current_block_height",
-            {"chain_id": self.chain_id, "network": self.network},
-        )
-        final_height = self.get_metric_value(
-            final_metrics,
-            "rcosmos_cometbft_current_block_height",
-            {"chain_id": self.chain_id, "network": self.network},
-        )
+        initial_height = self._chain_metric(initial_metrics, CURRENT_BLOCK_HEIGHT)
+        final_height = self._chain_metric(final_metrics, CURRENT_BLOCK_HEIGHT)
 
         if initial_height is not None and final_height is not None:
             if final_height < initial_height:
@@ -204,27 +524,12 @@ class MetricValidator:
 
         # Check validator missed_blocks counters are monotonic
         try:
-            validators = self.get_validators()
+            if validators is None:
+                validators = self.get_validators()
             for validator in validators[:10]:  # Check first 10
                 addr = validator["address"]
-                initial_missed = self.get_metric_value(
-                    initial_metrics,
-                    "rcosmos_cometbft_validator_missed_blocks",
-                    {
-                        "address": addr,
-                        "chain_id": self.chain_id,
-                        "network": self.network,
-                    },
-                )
-                final_missed = self.get_metric_value(
-                    final_metrics,
-                    "rcosmos_cometbft_validator_missed_blocks",
-                    {
-                        "address": addr,
-                        "chain_id": self.chain_id,
-                        "network": self.network,
-                    },
-                )
+                initial_missed = self._missed_for(initial_metrics, addr)
+                final_missed = self._missed_for(final_metrics, addr)
 
                 if initial_missed is not None and final_missed is not None:
                     if final_missed < initial_missed:
@@ -240,8 +545,9 @@ class MetricValidator:
         self,
         start_height: int,
         end_height: int,
-        initial_metrics: Dict[str, float],
-        final_metrics: Dict[str, float],
+        initial_metrics: MetricsStore,
+        final_metrics: MetricsStore,
+        validators: Optional[List[Dict]] = None,
     ) -> Tuple[bool, List[str]]:
         """
         Validate that missed_blocks counter increases when validators don't sign blocks.
@@ -254,58 +560,18 @@ class MetricValidator:
         warnings = []
 
         try:
-            validators = self.get_validators()
+            if validators is None:
+                validators = self.get_validators()
             validator_addresses = {v["address"] for v in validators}
 
-            # Track which validators signed which blocks
-            validator_signed_blocks = {addr: set() for addr in validator_addresses}
-
-            # Sample blocks in the processed range
-            sample_size = min(20, end_height - start_height + 1)
-            sample_heights = []
-            if end_height - start_height >= sample_size:
-                step = max(1, (end_height - start_height) // sample_size)
-                sample_heights = [start_height + i * step for i in range(sample_size)]
-            else:
-                sample_heights = list(range(start_height, end_height + 1))
-
-            for height in sample_heights:
-                try:
-                    block = self.get_block(height)
-                    signed_validators = self.calculate_expected_signatures(block)
-                    for validator in signed_validators:
-                        if validator in validator_signed_blocks:
-                            validator_signed_blocks[validator].add(height)
-                except Exception as e:
-                    warnings.append(f"Could not fetch block {height}: {e}")
-
             # Get list of tracked validators (validators who have signed at least once and are being tracked)
             # In CI, the exporter may have just started, so we only validate validators that are actually tracked
-            tracked_validators = set()
-            for validator in validator_addresses:
-                # Check if validator has a missed_blocks counter (initial or final)
-                # This means they've been tracked by the exporter (have signed at least once)
-                initial_missed = self.get_metric_value(
-                    initial_metrics,
-                    "rcosmos_cometbft_validator_missed_blocks",
-                    {
-                        "address": validator,
-                        "chain_id": self.chain_id,
-                        "network": self.network,
-                    },
-                )
-                final_missed = self.get_metric_value(
-                    final_metrics,
-                    "rcosmos_cometbft_validator_missed_blocks",
-                    {
-                        "address": validator,
-                        "chain_id": self.chain_id,
-                        "network": self.network,
-                    },
-                )
-                # If validator has the counter (even if 0), they're being tracked
-                if initial_missed is not None or final_missed is not None:
-                    tracked_validators.add(validator)
+            # A validator with a missed_blocks counter (initial or final, even if 0) is tracked
+            initial_missed_by_addr = self._missed_by_address(initial_metrics)
+            final_missed_by_addr = self._missed_by_address(final_metrics)
+            tracked_validators = validator_addresses & (
+                initial_missed_by_addr.keys() | final_missed_by_addr.keys()
+            )
 
             # Only validate validators that are actually being tracked by the exporter
             # This is important in CI where the exporter may have just started
@@ -315,33 +581,41 @@ class MetricValidator:
                 )
                 return True, warnings
 
+            # Sample blocks in the processed range
+            # Heights come from a range, so they are unique and sorted, and
+            # len(sample_heights) is the number of distinct blocks sampled
+            sample_size = min(20, end_height - start_height + 1)
+            if end_height - start_height >= sample_size:
+                step = max(1, (end_height - start_height) // sample_size)
+                sample_heights = list(
+                    range(start_height, start_height + sample_size * step, step)
+                )
+            else:
+                sample_heights = list(range(start_height, end_height + 1))
+
+            # Count sampled blocks signed by each tracked validator
+            signed_counts = Counter()
+            blocks, failures = self.get_blocks(sample_heights)
+            for height in sample_heights:
+                if height in failures:
+                    warnings.append(
+                        f"Could not fetch block {height}: {failures[height]}"
+                    )
+                    continue
+                signed_validators = self.calculate_expected_signatures(blocks[height])
+                signed_counts.update(signed_validators & tracked_validators)
+
             # Validate missed blocks counter increased correctly
             # Only check validators who are being tracked
             for validator in list(tracked_validators)[
                 :10
             ]:  # Check first 10 tracked validators
-                signed_count = len(validator_signed_blocks.get(validator, set()))
+                signed_count = signed_counts[validator]
                 total_blocks = len(sample_heights)
                 expected_missed = total_blocks - signed_count
 
-                initial_missed = self.get_metric_value(
-                    initial_metrics,
-                    "rcosmos_cometbft_validator_missed_blocks",
-                    {
-                        "address": validator,
-                        "chain_id": self.chain_id,
-                        "network": self.network,
-                    },
-                )
-                final_missed = self.get_metric_value(
-                    final_metrics,
-                    "rcosmos_cometbft_validator_missed_blocks",
-                    {
-                        "address": validator,
-                        "chain_id": self.chain_id,
-                        "network": self.network,
-                    },
-                )
+                initial_missed = initial_missed_by_addr.get(validator)
+                final_missed = final_missed_by_addr.get(validator)
 
                 # Validator is tracked, so both should exist (or at least final should)
                 if initial_missed is not None and final_missed is not None:
@@ -364,16 +638,35 @@ class MetricValidator:
     def validate_sequential_processing(
         self, start_height: int, end_height: int
     ) -> Tuple[bool, List[str]]:
-        """Validate that blocks are processed sequentially without gaps."""
+        """Validate that blocks are processed sequentially without gaps.
+
+        Only block existence matters here, so this reads block headers from the
+        blockchain endpoint a page at a time instead of fetching block bodies.
+        """
         errors = []
-        # Fetch blocks and check for gaps
+        # Fetch block headers and check for gaps
         heights_processed = set()
-        for height in range(start_height, end_height + 1):
+        for low in range(start_height, end_height + 1, BLOCKCHAIN_PAGE_SIZE):
+            high = min(low + BLOCKCHAIN_PAGE_SIZE - 1, end_height)
+            # A JSON-RPC error reply or a malformed page is a page failure too
             try:
-                block = self.get_block(height)
-                heights_processed.add(height)
+                response = self.fetch_rpc(
+                    f"blockchain?minHeight={low}&maxHeight={high}"
+                )
+                if response.get("error"):
+                    raise Exception(f"RPC request failed: {response['error']}")
+                returned = {
+                    int(meta["header"]["height"])
+                    for meta in response["result"]["block_metas"]
+                }
             except Exception as e:
-                errors.append(f"Could not fetch block {height}: {e}")
+                errors.append(f"Could not fetch blocks {low}-{high}: {e}")
+                continue
+            for height in range(low, high + 1):
+                if height in returned:
+                    heights_processed.add(height)
+                else:
+                    errors.append(f"Could not fetch block {height}: not found")
 
         # Check for gaps
         if heights_processed:
@@ -403,13 +696,8 @@ class MetricValidator:
         # Capture baseline metrics
         print("📸 Capturing baseline metrics...")
         try:
-            baseline_metrics_text = self.fetch_metrics()
-            baseline_metrics = self.parse_metrics(baseline_metrics_text)
-            baseline_height = self.get_metric_value(
-                baseline_metrics,
-                "rcosmos_cometbft_current_block_height",
-                {"chain_id": self.chain_id, "network": self.network},
-            )
+            baseline_metrics = self.fetch_metrics()
+            baseline_height = self._chain_metric(baseline_metrics, CURRENT_BLOCK_HEIGHT)
             if baseline_height is None:
                 all_errors.append("Could not get baseline current_block_height")
                 return False, all_errors
@@ -429,19 +717,17 @@ class MetricValidator:
         print(
             f"⏳ Waiting for exporter to process at least {num_blocks} blocks (max {wait_time}s)..."
         )
-        start_time = time.time()
+        start_time = time.monotonic()
+        deadline = start_time + wait_time
         initial_height = None
-        poll_interval = 5  # Check every 5 seconds
+        poll_step = 0
+        last_scrape = None  # (metrics, time.monotonic() of fetch)
 
-        while time.time() - start_time < wait_time:
+        while time.monotonic() < deadline:
             try:
-                metrics_text = self.fetch_metrics()
-                metrics = self.parse_metrics(metrics_text)
-                current_height = self.get_metric_value(
-                    metrics,
-                    "rcosmos_cometbft_current_block_height",
-                    {"chain_id": self.chain_id, "network": self.network},
-                )
+                metrics = self.fetch_metrics()
+                last_scrape = (metrics, time.monotonic())
+                current_height = self._chain_metric(metrics, CURRENT_BLOCK_HEIGHT)
 
                 if current_height is not None:
                     if initial_height is None:
@@ -449,7 +735,7 @@ class MetricValidator:
                         print(f"   Initial block height: {initial_height}")
 
                     blocks_processed = int(current_height) - initial_height
-                    elapsed = int(time.time() - start_time)
+                    elapsed = int(time.monotonic() - start_time)
 
                     if blocks_processed >= num_blocks:
                         print(
@@ -462,15 +748,19 @@ class MetricValidator:
                         )
                 else:
                     print(
-                        f"   Waiting for metrics to be available ({int(time.time() - start_time)}s elapsed)..."
+                        f"   Waiting for metrics to be available ({int(time.monotonic() - start_time)}s elapsed)..."
                     )
             except Exception as e:
                 # If we can't fetch metrics yet, just wait
                 pass
 
-            time.sleep(poll_interval)
+            # Poll quickly at first in case the exporter is already caught up,
+            # then back off to the slowest interval
+            poll_interval = POLL_SCHEDULE[min(poll_step, len(POLL_SCHEDULE) - 1)]
+            poll_step += 1
+            time.sleep(max(0.0, min(poll_interval, deadline - time.monotonic())))
 
-        elapsed_total = int(time.time() - start_time)
+        elapsed_total = int(time.monotonic() - start_time)
         if elapsed_total >= wait_time:
             print(
                 f"⏱️  Reached max wait time ({wait_time}s), proceeding with validation..."
@@ -479,11 +769,17 @@ class MetricValidator:
             print(f"✅ Ready for validation after {elapsed_total}s")
         print()
 
-        # Fetch metrics (we may have already fetched them, but fetch fresh for validation)
+        # Reuse the last poll scrape if it is recent, otherwise fetch fresh
         try:
-            metrics_text = self.fetch_metrics()
-            metrics = self.parse_metrics(metrics_text)
-            print(f"✅ Fetched {len(metrics)} metrics from exporter")
+            if (
+                last_scrape is not None
+                and time.monotonic() - last_scrape[1] <= METRICS_STALENESS_BUDGET
+            ):
+                metrics = last_scrape[0]
+            else:
+                metrics = self.fetch_metrics()
+            num_samples = sum(len(samples) for samples in metrics.values())
+            print(f"✅ Fetched {num_samples} cometbft metrics from exporter")
         except Exception as e:
             all_errors.append(f"Failed to fetch metrics: {e}")
             return False, all_errors
@@ -497,11 +793,7 @@ class MetricValidator:
             return False, all_errors
 
         # Get current block height from metrics
-        current_height_metric = self.get_metric_value(
-            metrics,
-            "rcosmos_cometbft_current_block_height",
-            {"chain_id": self.chain_id, "network": self.network},
-        )
+        current_height_metric = self._chain_metric(metrics, CURRENT_BLOCK_HEIGHT)
         if current_height_metric is None:
             all_errors.append("current_block_height metric not found")
             return False, all_errors
@@ -512,11 +804,7 @@ class MetricValidator:
         # Validate gap metric - check if we're catching up (gap decreasing)
         # In CI, exporter may start with a large gap due to initial backfill
         # We care more about catchup rate than absolute gap size
-        gap_metric = self.get_metric_value(
-            metrics,
-            "rcosmos_cometbft_block_gap",
-            {"chain_id": self.chain_id, "network": self.network},
-        )
+        gap_metric = self._chain_metric(metrics, BLOCK_GAP)
         if gap_metric is not None:
             expected_gap = latest_height - current_height
             current_gap = int(gap_metric)
@@ -581,21 +869,24 @@ class MetricValidator:
         print(
             f"\n📊 Validating transaction and validator data from {num_blocks} sample blocks..."
         )
-        sample_heights = []
-        if current_height >= num_blocks:
-            # Sample from recent blocks (within processed range)
-            for i in range(num_blocks):
-                sample_heights.append(current_height - i)
-        else:
-            # Sample from available blocks
-            for i in range(min(num_blocks, current_height)):
-                sample_heights.append(current_height - i)
+        # Sample the most recent blocks (within processed range), or as many as exist
+        sample_heights = list(
+            range(current_height, current_height - min(num_blocks, current_height), -1)
+        )
 
         block_warnings = 0
+        # Fetch all sample blocks concurrently; validation below stays serial
+        blocks, failures = self.get_blocks(sample_heights)
         for height in sample_heights:
+            if height in failures:
+                all_warnings.append(
+                    f"Block {height}: Could not validate - {failures[height]}"
+                )
+                continue
             try:
-                block = self.get_block(height)
-                is_valid, issues = self.validate_block_metrics(height, block, metrics)
+                is_valid, issues = self.validate_block_metrics(
+                    height, blocks[height], metrics
+                )
                 # All issues from block validation are warnings (not errors)
                 # because we're validating historical blocks against current metrics
                 for issue in issues:
@@ -616,6 +907,7 @@ class MetricValidator:
         # Note: The missed_blocks counter only exists for validators who have missed blocks
         # Validators who haven't missed any blocks won't have this metric (expected behavior)
         print(f"\n👥 Validating validator metrics...")
+        validators = None
         try:
             validators = self.get_validators()
             validator_metrics_found = 0
@@ -624,15 +916,7 @@ class MetricValidator:
 
             for validator in validators[:10]:  # Check first 10 validators
                 addr = validator["address"]
-                missed = self.get_metric_value(
-                    metrics,
-                    "rcosmos_cometbft_validator_missed_blocks",
-                    {
-                        "address": addr,
-                        "chain_id": self.chain_id,
-                        "network": self.network,
-                    },
-                )
+                missed = self._missed_for(metrics, addr)
                 if missed is not None:
                     validator_metrics_found += 1
                     # Check if missed blocks count is reasonable (not negative, not absurdly high)
@@ -663,7 +947,7 @@ class MetricValidator:
         # Validate monotonicity (counters only increase)
         print(f"\n📈 Validating metric monotonicity...")
         is_monotonic, monotonic_issues = self.validate_monotonicity(
-            baseline_metrics, metrics
+            baseline_metrics, metrics, validators
         )
         if not is_monotonic:
             all_errors.extend([i for i in monotonic_issues if "decreased" in i.lower()])
@@ -679,19 +963,99 @@ class MetricValidator:
             start_height = int(baseline_height) + 1
             end_height = current_height
             is_correlated, correlation_issues = self.validate_missed_blocks_correlation(
-                start_height, end_height, baseline_metrics, metrics
+                start_height, end_height, baseline_metrics, metrics, validators
             )
-            all_warnings.extend(correlation_issues)
+            if correlation_issues:
+                all_warnings.extend(correlation_issues)
             if is_correlated:
                 print("✅ Missed blocks counter correlates with validator signatures")
 
         return len(all_errors) == 0, all_errors + all_warnings
 
 
-def load_config(config_path: str) -> Dict:
-    """Load YAML config file."""
+@functools.lru_cache(maxsize=1)
+def _yaml_loader():
+    """Import PyYAML on first use and return (yaml, fastest safe loader)."""
+    try:
+        import yaml
+    except ImportError:
+        print("❌ PyYAML not installed. Install with: pip install pyyaml")
+        sys.exit(1)
+    # Prefer the libyaml-backed loader; PyYAML builds without libyaml lack it
+    return yaml, getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+@functools.lru_cache(maxsize=8)
+def _load_config_cached(config_path: str, mtime: float) -> Dict:
+    """Parse a YAML config file; mtime is part of the cache key only."""
+    yaml, loader = _yaml_loader()
     with open(config_path, "r") as f:
-        return yaml.safe_load(f)
+        return yaml.load(f, Loader=loader)
+
+
+def load_config(config_path: str) -> Dict:
+    """Load YAML config file, reparsing only when it has changed."""
+    config = _load_config_cached(config_path, os.path.getmtime(config_path))
+    # Callers get their own copy so they can't alter the cached config
+    return copy.deepcopy(config)
+
+
+def block_module_maybe_enabled(config_path: str) -> bool:
+    """Cheap byte scan of a config for the cometbft block module being on.
+
+    False means the module is definitely not enabled; True means the config
+    has to be parsed to tell. "enabled:" values are matched as YAML reads
+    them, so True, yes and on count as well as true. Unreadable files return
+    True so load_config reports the error.
+    """
+    try:
+        with open(config_path, "rb") as f:
+            raw = f.read()
+    except OSError:
+        return True
+    return (
+        b"cometbft:" in raw
+        and b"block:" in raw
+        and ENABLED_TRUE_RE.search(raw) is not None
+    )
+
+
+def _exit_skipped():
+    """Exit 0 immediately for a skipped validation.
+
+    Nothing has been opened yet on this path, so interpreter teardown is
+    skipped; stdout is flushed by hand because os._exit won't do it.
+    """
+    sys.stdout.flush()
+    os._exit(0)
+
+
+def _split_issues(issues: List[str]) -> Tuple[List[str], List[str]]:
+    """Partition issues into (errors, warnings) in a single pass.
+
+    Only critical issues are errors: gap too large, metrics completely missing.
+    """
+    errors: List[str] = []
+    warnings: List[str] = []
+    is_critical = CRITICAL_ISSUE_RE.search
+    add_error = errors.append
+    add_warning = warnings.append
+    for issue in issues:
+        if is_critical(issue):
+            add_error(issue)
+        else:
+            add_warning(issue)
+    return errors, warnings
+
+
+def _emit_section(out: List[str], icon: str, label: str, items: List[str], cap: int):
+    """Append a capped report section (header, items, "and N more")."""
+    out.append(f"\n{icon} {len(items)} {label}(s):")
+    for item in itertools.islice(items, cap):
+        out.append(f"  {icon} {item}")
+    extra = len(items) - cap
+    if extra > 0:
+        out.append(f"  ... and {extra} more {label}s")
 
 
 def main():
@@ -716,8 +1080,20 @@ def main():
         default="http://localhost:9100/metrics",
         help="Metrics endpoint URL",
     )
+    parser.add_argument(
+        "--quiet",
+        action="store_true",
+        help="Skip the results report; only the exit code reports the outcome",
+    )
     args = parser.parse_args()
 
+    # Skip the YAML parse entirely for configs that can't enable the block module
+    if not block_module_maybe_enabled(args.config):
+        print(
+            f"⚠️  CometBFT block module not enabled in {args.config}, skipping validation"
+        )
+        _exit_skipped()
+
     # Load config
     try:
         config = load_config(args.config)
@@ -726,30 +1102,29 @@ def main():
         sys.exit(1)
 
     # Extract config values
-    general = config.get("general", {})
+    general = config.get("general") or {}
     chain_id = general.get("chain_id", "")
     network = general.get("network", "")
-    nodes = general.get("nodes", {})
-    rpc_nodes = nodes.get("rpc", [])
+    rpc_nodes = (general.get("nodes") or {}).get("rpc") or []
 
     if not rpc_nodes:
         print("❌ No RPC nodes found in config")
         sys.exit(1)
 
-    rpc_url = rpc_nodes[0].get("url", "").rstrip("/")
+    rpc_url = (rpc_nodes[0].get("url") or "").rstrip("/")
     if not rpc_url:
         print("❌ No RPC URL found in config")
         sys.exit(1)
 
     # Check if cometbft block module is enabled
-    network_config = config.get("network", {})
-    cometbft_config = network_config.get("cometbft", {})
-    block_config = cometbft_config.get("block", {})
-    if not block_config.get("enabled", False):
+    network_config = config.get("network") or {}
+    cometbft_config = network_config.get("cometbft") or {}
+    block_config = cometbft_config.get("block") or {}
+    if not block_config.get("enabled"):
         print(
             f"⚠️  CometBFT block module not enabled for {chain_id}, skipping validation"
         )
-        sys.exit(0)
+        _exit_skipped()
 
     # Check if we have required values
     if not chain_id or not network:
@@ -757,43 +1132,32 @@ def main():
         sys.exit(1)
 
     # Run validation
-    validator = MetricValidator(rpc_url, args.metrics_url, chain_id, network)
-    success, issues = validator.run_validation(args.num_blocks, args.wait_time)
-
-    # Print results
-    print("\n" + "=" * 60)
-    # Only critical issues are errors: gap too large, metrics completely missing
-    errors = [
-        i
-        for i in issues
-        if "gap too large" in i.lower()
-        or ("not found" in i.lower() and "current_block_height" in i.lower())
-    ]
-    warnings = [i for i in issues if i not in errors]
+    with MetricValidator(rpc_url, args.metrics_url, chain_id, network) as validator:
+        success, issues = validator.run_validation(args.num_blocks, args.wait_time)
+
+    if args.quiet:
+        sys.exit(0 if success else 1)
+
+    # Print results, collected and written at once
+    out = ["", "=" * 60]
+    errors, warnings = _split_issues(issues)
 
     if success:
-        print("✅ VALIDATION PASSED")
-        if warnings:
-            print(f"\n⚠️  {len(warnings)} warning(s):")
-            for warning in warnings[:5]:  # Show first 5 warnings
-                print(f"  ⚠️  {warning}")
-            if len(warnings) > 5:
-                print(f"  ... and {len(warnings) - 5} more warnings")
+        out.append(f"{OK_ICON} VALIDATION PASSED")
     else:
-        print("❌ VALIDATION FAILED")
+        out.append(f"{ERR_ICON} VALIDATION FAILED")
         if errors:
-            print(f"\n❌ {len(errors)} error(s):")
-            for error in errors[:10]:  # Show first 10 errors
-                print(f"  ❌ {error}")
-            if len(errors) > 10:
-                print(f"  ... and {len(errors) - 10} more errors")
-        if warnings:
-            print(f"\n⚠️  {len(warnings)} warning(s):")
-            for warning in warnings[:5]:  # Show first 5 warnings
-                print(f"  ⚠️  {warning}")
-            if len(warnings) > 5:
-                print(f"  ... and {len(warnings) - 5} more warnings")
-    print("=" * 60)
+            _emit_section(out, ERR_ICON, "error", errors, 10)  # First 10
+    if warnings:
+        # The warning sign renders narrow, so it carries an extra space
+        _emit_section(out, f"{WARN_ICON} ", "warning", warnings, 5)  # First 5
+    out.append("=" * 60)
+    # Encode the whole report once and write the bytes, after anything still
+    # buffered in the text layer
+    report = ("\n".join(out) + "\n").encode("utf-8")
+    sys.stdout.flush()
+    sys.stdout.buffer.write(report)
+    sys.stdout.buffer.flush()
 
     sys.exit(0 if success else 1)
 